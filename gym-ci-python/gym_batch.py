@@ -0,0 +1,171 @@
+"""
+Cálculo de costos en lote (vectorizado con NumPy).
+
+Permite calcular el total de muchas solicitudes de membresía a la vez,
+por ejemplo para un reporte que cotiza miles de planes posibles.
+Aplica exactamente las mismas reglas que `calcular_costos`.
+
+Representación de las solicitudes (una fila por solicitud):
+- codigos: índice del plan dentro de CODIGOS_PLANES
+- num_miembros: número de miembros
+- mascara_extras: matriz N x len(CODIGOS_CARACTERISTICAS) con 1 si la
+  característica está seleccionada y 0 si no
+
+Si `numba` está instalado, el cálculo se compila con @njit y se reparte
+entre núcleos; si no, se usa la versión NumPy con el mismo resultado.
+"""
+
+from typing import List
+
+import numpy as np
+
+from gym_membership import MEMBRESIAS
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba es opcional
+    njit = None
+    prange = range  # pylint: disable=invalid-name
+
+
+# ------------------------ TABLAS PRECALCULADAS ------------------------ #
+
+# Orden de las filas (planes) y columnas (características) de las tablas
+CODIGOS_PLANES: List[str] = list(MEMBRESIAS)
+CODIGOS_CARACTERISTICAS: List[str] = list(
+    dict.fromkeys(cod for m in MEMBRESIAS.values() for cod in m.caracteristicas)
+)
+
+PRECIOS_BASE = np.array([m.precio_base for m in MEMBRESIAS.values()], dtype=np.int64)
+ES_PREMIUM = np.array([m.es_premium for m in MEMBRESIAS.values()], dtype=np.bool_)
+
+# Costo de cada característica por plan (0 si el plan no la ofrece)
+TABLA_COSTOS = np.array(
+    [
+        [m.caracteristicas.get(cod, 0) for cod in CODIGOS_CARACTERISTICAS]
+        for m in MEMBRESIAS.values()
+    ],
+    dtype=np.int64,
+)
+DISPONIBLES = np.array(
+    [
+        [cod in m.caracteristicas for cod in CODIGOS_CARACTERISTICAS]
+        for m in MEMBRESIAS.values()
+    ],
+    dtype=np.bool_,
+)
+
+
+# ------------------------ LÓGICA DE NEGOCIO ------------------------ #
+
+def calcular_costos_batch(codigos, num_miembros, mascara_extras) -> np.ndarray:
+    """
+    Calcula el total a pagar de N solicitudes sin bucles en Python.
+
+    Devuelve un arreglo int64 de longitud N con el mismo valor que
+    `calcular_costos(...)["total"]` para cada solicitud.
+    Lanza ValueError si las formas de los arreglos no coinciden, si los
+    códigos o el número de miembros no son enteros, si algún código no corresponde a un plan, si algún número de miembros es
+    <= 0 o si se selecciona una característica que el plan no ofrece.
+    """
+    codigos = np.asarray(codigos)
+    n = np.asarray(num_miembros)
+    mascara = np.asarray(mascara_extras, dtype=np.bool_)
+    if not np.issubdtype(codigos.dtype, np.integer) or not np.issubdtype(n.dtype, np.integer):
+        raise ValueError("Los códigos de plan y el número de miembros deben ser enteros.")
+    # Sin esta validación NumPy haría broadcasting de entradas de distinto tamaño
+    if (
+        codigos.ndim != 1
+        or n.shape != codigos.shape
+        or mascara.shape != (codigos.shape[0], len(CODIGOS_CARACTERISTICAS))
+    ):
+        raise ValueError(
+            "Se esperaban codigos y num_miembros de forma (N,) y "
+            f"mascara_extras de forma (N, {len(CODIGOS_CARACTERISTICAS)})."
+        )
+    # Sin esta validación NumPy aceptaría índices negativos como otro plan
+    if np.any((codigos < 0) | (codigos >= len(CODIGOS_PLANES))):
+        raise ValueError("Código de plan no válido.")
+
+    codigos = codigos.astype(np.intp, copy=False)
+    n = n.astype(np.int64, copy=False)
+
+    if np.any(n <= 0):
+        raise ValueError("El número de miembros debe ser mayor que 0.")
+    if np.any(mascara & ~DISPONIBLES[codigos]):
+        raise ValueError("Característica no disponible para esta membresía.")
+
+    if _KERNEL_NUMBA is not None:
+        totales = np.empty(codigos.shape[0], dtype=np.int64)
+        _KERNEL_NUMBA(codigos, n, mascara, TABLA_COSTOS, ES_PREMIUM, PRECIOS_BASE, totales)
+        return totales
+    return _totales_numpy(codigos, n, mascara)
+
+
+def _totales_numpy(codigos: np.ndarray, n: np.ndarray, mascara: np.ndarray) -> np.ndarray:
+    # 1-3. Subtotal = (precio base + extras por miembro) * miembros
+    extras = (TABLA_COSTOS[codigos] * mascara).sum(axis=1)
+    subtotal = (PRECIOS_BASE[codigos] + extras) * n
+
+    # 4. Recargo premium (15%, redondeo "mitad hacia arriba")
+    subtotal += np.where(ES_PREMIUM[codigos], (subtotal * 15 + 50) // 100, 0)
+
+    # 5. Descuento grupal (10%) si 2 o más miembros
+    subtotal -= np.where(n >= 2, (subtotal * 10 + 50) // 100, 0)
+
+    # 6. Descuento especial por monto
+    subtotal -= np.where(subtotal > 400, 50, np.where(subtotal > 200, 20, 0))
+
+    # Garantizar entero positivo
+    np.maximum(subtotal, 0, out=subtotal)
+    return subtotal
+
+
+def _totales_kernel(codigos, n, mascara, tabla_costos, es_premium, precios_base, totales):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """
+    Misma lógica que `_totales_numpy`, una solicitud por iteración.
+    Cada iteración escribe solo totales[i], por lo que se puede paralelizar.
+    Numba no verifica límites: las formas deben validarse antes de llamarla.
+    """
+    for i in prange(codigos.shape[0]):  # pylint: disable=not-an-iterable
+        c = codigos[i]
+
+        # 1-3. Subtotal = (precio base + extras por miembro) * miembros
+        extras = 0
+        for j in range(tabla_costos.shape[1]):
+            if mascara[i, j]:
+                extras += tabla_costos[c, j]
+        subtotal = (precios_base[c] + extras) * n[i]
+
+        # 4. Recargo premium (15%, redondeo "mitad hacia arriba")
+        if es_premium[c]:
+            subtotal += (subtotal * 15 + 50) // 100
+
+        # 5. Descuento grupal (10%) si 2 o más miembros
+        if n[i] >= 2:
+            subtotal -= (subtotal * 10 + 50) // 100
+
+        # 6. Descuento especial por monto
+        if subtotal > 400:
+            subtotal -= 50
+        elif subtotal > 200:
+            subtotal -= 20
+
+        # Garantizar entero positivo
+        totales[i] = max(subtotal, 0)
+
+
+if njit is not None:
+    _KERNEL_NUMBA = njit(parallel=True, cache=True)(_totales_kernel)
+    # Compilar al importar para que la primera llamada real no pague el JIT
+    _KERNEL_NUMBA(
+        np.zeros(1, dtype=np.intp),
+        np.ones(1, dtype=np.int64),
+        np.zeros((1, len(CODIGOS_CARACTERISTICAS)), dtype=np.bool_),
+        TABLA_COSTOS,
+        ES_PREMIUM,
+        PRECIOS_BASE,
+        np.empty(1, dtype=np.int64),
+    )
+else:
+    _KERNEL_NUMBA = None
@@ -14,19 +14,31 @@ Requisitos cubiertos:
 - Manejo básico de errores con mensajes descriptivos
 """
 
-from dataclasses import dataclass
-from typing import List, Dict
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Tuple
 
 
 # ------------------------ MODELO DE DATOS ------------------------ #
 
-@dataclass
+# slots=True solo existe desde Python 3.10; en 3.8/3.9 se usa la dataclass normal
+_OPCIONES_DATACLASS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_OPCIONES_DATACLASS)
 class Membresia:
     codigo: str
     nombre: str
     precio_base: int
     es_premium: bool
-    caracteristicas: Dict[str, int]  # clave: código de característica, valor: costo
+    # clave: código de característica, valor: costo (solo lectura; no entra en el hash)
+    caracteristicas: Mapping[str, int] = field(hash=False)
+
+    def __post_init__(self) -> None:
+        # Copia de solo lectura: una membresía no cambia después de crearse
+        object.__setattr__(self, "caracteristicas", MappingProxyType(dict(self.caracteristicas)))
 
 
 # Definición de los planes de membresía y sus características adicionales
@@ -67,6 +79,11 @@ MEMBRESIAS: Dict[str, Membresia] = {
 
 # ------------------------ LÓGICA DE NEGOCIO ------------------------ #
 
+def _codigos_invalidos(codigos_caracteristicas: List[str], caracteristicas: Mapping[str, int]) -> str:
+    invalidas = set(codigos_caracteristicas).difference(caracteristicas)
+    return ", ".join(sorted(map(str, invalidas)))
+
+
 def calcular_costos(
     membresia: Membresia,
     numero_miembros: int,
@@ -91,18 +108,21 @@ def calcular_costos(
     if numero_miembros <= 0:
         raise ValueError("El número de miembros debe ser mayor que 0.")
 
-    # Validar características
-    for cod in codigos_caracteristicas:
-        if cod not in membresia.caracteristicas:
-            raise ValueError(f"Característica no disponible para esta membresía: {cod}")
-
     # 1. Costo base
     costo_base = membresia.precio_base * numero_miembros
 
     # 2. Costo de características adicionales (por miembro)
+    # La validación se hace solo si falla la búsqueda, para no pagarla en el caso normal
+    caracteristicas = membresia.caracteristicas
     costo_extra_por_miembro = 0
-    for cod in codigos_caracteristicas:
-        costo_extra_por_miembro += membresia.caracteristicas[cod]
+    try:
+        for cod in codigos_caracteristicas:
+            costo_extra_por_miembro += caracteristicas[cod]
+    except KeyError:
+        raise ValueError(
+            "Característica no disponible para esta membresía: "
+            + _codigos_invalidos(codigos_caracteristicas, caracteristicas)
+        ) from None
 
     costo_extras = costo_extra_por_miembro * numero_miembros
 
@@ -112,18 +132,15 @@ def calcular_costos(
     # 4. Recargo premium (15%)
     recargo_premium = 0
     if membresia.es_premium:
-        recargo_premium = int(round(subtotal * 0.15))
-        subtotal_con_recargo = subtotal + recargo_premium
-    else:
-        subtotal_con_recargo = subtotal
+        # Aritmética entera con redondeo "mitad hacia arriba" (sin floats)
+        recargo_premium = (subtotal * 15 + 50) // 100
+    subtotal_con_recargo = subtotal + recargo_premium
 
     # 5. Descuento grupal (10%) si 2 o más miembros
     descuento_grupal = 0
     if numero_miembros >= 2:
-        descuento_grupal = int(round(subtotal_con_recargo * 0.10))
-        total_parcial = subtotal_con_recargo - descuento_grupal
-    else:
-        total_parcial = subtotal_con_recargo
+        descuento_grupal = (subtotal_con_recargo * 10 + 50) // 100
+    total_parcial = subtotal_con_recargo - descuento_grupal
 
     # 6. Descuento especial por monto
     descuento_especial = 0
@@ -132,10 +149,8 @@ def calcular_costos(
     elif total_parcial > 200:
         descuento_especial = 20
 
-    total_final = total_parcial - descuento_especial
-
     # Garantizar entero positivo
-    total_final = max(total_final, 0)
+    total_final = max(total_parcial - descuento_especial, 0)
 
     return {
         "costo_base": costo_base,
@@ -146,6 +161,7 @@ def calcular_costos(
         "total": int(total_final),
     }
 
+
 def procesar_plan_membresia(
     codigo_membresia: str,
     numero_miembros: int,
@@ -160,6 +176,9 @@ def procesar_plan_membresia(
       * Hay características inválidas
       * El número de miembros es inválido
       * El usuario cancela (confirmar == False)
+
+    El resultado se guarda en caché por (membresía, miembros, características
+    ordenadas), así que un cambio en MEMBRESIAS nunca devuelve un total viejo.
     """
 
     if not confirmar:
@@ -171,7 +190,23 @@ def procesar_plan_membresia(
         return -1
 
     try:
-        detalle = calcular_costos(membresia, numero_miembros, codigos_caracteristicas)
+        caracteristicas = tuple(sorted(codigos_caracteristicas))
+        hash(caracteristicas)
+    except TypeError:
+        # Códigos que no se pueden ordenar o usar como clave (p. ej. None junto a un str)
+        return -1
+
+    return _total_cacheado(membresia, numero_miembros, caracteristicas)
+
+
+@lru_cache(maxsize=256, typed=True)
+def _total_cacheado(
+    membresia: Membresia,
+    numero_miembros: int,
+    codigos_caracteristicas: Tuple[str, ...],
+) -> int:
+    try:
+        detalle = calcular_costos(membresia, numero_miembros, list(codigos_caracteristicas))
     except ValueError:
         return -1
 
@@ -181,28 +216,32 @@ def procesar_plan_membresia(
 
 # ------------------------ INTERFAZ DE CONSOLA (CLI) ------------------------ #
 
-def mostrar_membresias():
+# Descripción de cada característica adicional para mostrar en consola
+_DESCRIPCIONES_CARACTERISTICAS: Dict[str, str] = {
+    "CG": "Clases grupales",
+    "LK": "Uso de lockers",
+    "EP": "Entrenador personal",
+    "SPA": "Acceso a spa / zona relax",
+    "CI": "Clases ilimitadas",
+    "CF": "Clases familiares",
+    "GD": "Guardería",
+}
+
+
+def mostrar_membresias() -> None:
     print("\n=== PLANES DE MEMBRESÍA DISPONIBLES ===")
     for m in MEMBRESIAS.values():
         tipo = " (Premium)" if m.es_premium else ""
         print(f"- {m.codigo}: {m.nombre}{tipo} - Precio base por miembro: ${m.precio_base}")
 
 
-def mostrar_caracteristicas(membresia: Membresia):
+def mostrar_caracteristicas(membresia: Membresia) -> None:
     print(f"\nCaracterísticas adicionales para el plan {membresia.nombre}:")
     if not membresia.caracteristicas:
         print("   No hay características adicionales disponibles.")
         return
     for cod, costo in membresia.caracteristicas.items():
-        descripcion = {
-            "CG": "Clases grupales",
-            "LK": "Uso de lockers",
-            "EP": "Entrenador personal",
-            "SPA": "Acceso a spa / zona relax",
-            "CI": "Clases ilimitadas",
-            "CF": "Clases familiares",
-            "GD": "Guardería",
-        }.get(cod, f"Opción {cod}")
+        descripcion = _DESCRIPCIONES_CARACTERISTICAS.get(cod, f"Opción {cod}")
         print(f"   {cod} - {descripcion}: ${costo} por miembro")
 
 
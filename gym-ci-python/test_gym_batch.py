@@ -0,0 +1,134 @@
+"""
+Pruebas del cálculo de costos en lote (gym_batch.py).
+
+Requisitos verificados:
+- Mismo total que calcular_costos para todas las combinaciones de cada plan
+- Manejo de entradas inválidas
+"""
+
+from itertools import combinations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# pylint: disable=wrong-import-position
+import gym_batch
+from gym_batch import CODIGOS_CARACTERISTICAS, CODIGOS_PLANES, calcular_costos_batch
+from gym_membership import MEMBRESIAS, calcular_costos
+
+
+def test_batch_coincide_con_calcular_costos():
+    """
+    Para cada plan, número de miembros (1 a 5) y subconjunto de características,
+    el total en lote debe ser igual al de calcular_costos.
+    """
+    codigos, miembros, mascaras, esperados = [], [], [], []
+    for indice, codigo in enumerate(CODIGOS_PLANES):
+        membresia = MEMBRESIAS[codigo]
+        disponibles = list(membresia.caracteristicas)
+        for n in range(1, 6):
+            for k in range(len(disponibles) + 1):
+                for seleccion in combinations(disponibles, k):
+                    codigos.append(indice)
+                    miembros.append(n)
+                    mascaras.append([cod in seleccion for cod in CODIGOS_CARACTERISTICAS])
+                    esperados.append(calcular_costos(membresia, n, list(seleccion))["total"])
+
+    totales = calcular_costos_batch(np.array(codigos), np.array(miembros), np.array(mascaras))
+
+    assert totales.tolist() == esperados
+
+
+def test_batch_kernel_numba_coincide_con_numpy():
+    """
+    Si numba está instalado, el kernel compilado debe dar los mismos totales
+    que la versión NumPy.
+    """
+    pytest.importorskip("numba")
+    rng = np.random.default_rng(0)
+    codigos = rng.integers(0, len(CODIGOS_PLANES), size=1000)
+    miembros = rng.integers(1, 10, size=1000)
+    mascara = rng.integers(0, 2, size=(1000, len(CODIGOS_CARACTERISTICAS))).astype(np.bool_)
+    mascara &= gym_batch.DISPONIBLES[codigos]
+
+    totales = calcular_costos_batch(codigos, miembros, mascara)
+    # pylint: disable=protected-access
+    esperados = gym_batch._totales_numpy(codigos, miembros.astype(np.int64), mascara)
+
+    assert totales.tolist() == esperados.tolist()
+
+
+def test_batch_numero_miembros_invalido():
+    """
+    Si algún número de miembros es <= 0, debe lanzar ValueError.
+    """
+    mascara = np.zeros((2, len(CODIGOS_CARACTERISTICAS)), dtype=np.uint8)
+    with pytest.raises(ValueError):
+        calcular_costos_batch(np.array([0, 1]), np.array([1, 0]), mascara)
+
+
+def test_batch_caracteristica_invalida():
+    """
+    Si se selecciona una característica que el plan no ofrece, debe lanzar ValueError.
+    """
+    mascara = np.zeros((1, len(CODIGOS_CARACTERISTICAS)), dtype=np.uint8)
+    mascara[0, CODIGOS_CARACTERISTICAS.index("EP")] = 1  # EP no es válido para BASIC
+    with pytest.raises(ValueError):
+        calcular_costos_batch(np.array([CODIGOS_PLANES.index("BASIC")]), np.array([1]), mascara)
+
+
+@pytest.mark.parametrize("codigo", [-1, len(CODIGOS_PLANES)])
+def test_batch_codigo_plan_fuera_de_rango(codigo):
+    """
+    Un índice de plan negativo o mayor que el número de planes debe lanzar ValueError
+    (NumPy interpretaría -1 como el último plan).
+    """
+    mascara = np.zeros((1, len(CODIGOS_CARACTERISTICAS)), dtype=np.uint8)
+    with pytest.raises(ValueError):
+        calcular_costos_batch(np.array([codigo]), np.array([1]), mascara)
+
+
+def test_batch_numero_miembros_no_entero():
+    """
+    Un número de miembros no entero (p. ej. 1.9) debe lanzar ValueError en lugar de truncarse.
+    """
+    mascara = np.zeros((1, len(CODIGOS_CARACTERISTICAS)), dtype=np.uint8)
+    with pytest.raises(ValueError):
+        calcular_costos_batch(np.array([0]), np.array([1.9]), mascara)
+
+
+FORMAS_INVALIDAS = [
+    # num_miembros de longitud 1 para 2 solicitudes
+    ([0, 1], [2], np.zeros((2, len(CODIGOS_CARACTERISTICAS)), dtype=np.bool_)),
+    # máscara con una sola columna
+    ([0], [1], np.zeros((1, 1), dtype=np.bool_)),
+    # num_miembros escalar
+    ([0, 1], 2, np.zeros((2, len(CODIGOS_CARACTERISTICAS)), dtype=np.bool_)),
+    # codigos en 2 dimensiones
+    ([[0, 1]], [[1, 1]], np.zeros((1, 2, len(CODIGOS_CARACTERISTICAS)), dtype=np.bool_)),
+]
+
+
+@pytest.fixture(params=["numpy", "numba"])
+def backend(request, monkeypatch):
+    """
+    Ejecuta la prueba con la versión NumPy y, si numba está instalado, con el kernel compilado.
+    """
+    # pylint: disable=protected-access
+    if request.param == "numpy":
+        monkeypatch.setattr(gym_batch, "_KERNEL_NUMBA", None)
+    elif gym_batch._KERNEL_NUMBA is None:
+        pytest.skip("numba no está instalado")
+    return request.param
+
+
+@pytest.mark.parametrize("codigos, miembros, mascara", FORMAS_INVALIDAS)
+def test_batch_formas_incompatibles(backend, codigos, miembros, mascara):  # pylint: disable=redefined-outer-name,unused-argument
+    """
+    Si las formas de los arreglos no coinciden, debe lanzar ValueError en lugar
+    de aplicar broadcasting (el kernel numba no verifica límites y leería
+    fuera de los arreglos).
+    """
+    with pytest.raises(ValueError):
+        calcular_costos_batch(np.array(codigos), np.array(miembros), mascara)
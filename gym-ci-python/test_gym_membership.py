@@ -18,13 +18,22 @@ from pathlib import Path
 
 import pytest
 
+import gym_membership
 from gym_membership import (
     MEMBRESIAS,
+    Membresia,
     calcular_costos,
     procesar_plan_membresia,
 )
 
 
+# Compilado con mypyc, el tipo int de numero_miembros se verifica en tiempo de ejecución
+solo_interpretado = pytest.mark.skipif(
+    not gym_membership.__file__.endswith(".py"),
+    reason="gym_membership compilado con mypyc no acepta floats como número de miembros",
+)
+
+
 # ---------------------- PRUEBAS FUNCIONALES (PYTEST) ---------------------- #
 
 
@@ -133,6 +142,76 @@ def test_family_cuatro_miembros_con_extras_y_descuento_especial_400():
     assert detalle["total"] == 688
 
 
+def test_familiar_tres_miembros_redondeo_mitad_hacia_arriba():
+    """
+    Los porcentajes se redondean "mitad hacia arriba" con aritmética entera.
+    FAMILY, 3 miembros, GD:
+    - Subtotal = (150 + 25) * 3 = 525
+    - Descuento grupal = 10% de 525 = 52.5 → 53
+    - Descuento especial: 472 > 400 → -50
+    - Total = 525 - 53 - 50 = 422
+    """
+    membresia = MEMBRESIAS["FAMILY"]
+    detalle = calcular_costos(membresia, numero_miembros=3, codigos_caracteristicas=["GD"])
+
+    assert detalle["descuento_grupal"] == 53
+    assert detalle["descuento_especial"] == 50
+    assert detalle["total"] == 422
+
+
+def test_calcular_costos_membresia_fuera_del_catalogo():
+    """
+    Una membresía que no está en MEMBRESIAS también se puede calcular.
+    - Base = 90 * 3 = 270, extras = 5 * 3 = 15 → subtotal 285
+    - Recargo premium = 15% de 285 = 42.75 → 43
+    - Descuento grupal = 10% de 328 = 32.8 → 33
+    - Descuento especial: 295 > 200 → -20
+    """
+    membresia = Membresia(
+        codigo="PRUEBA",
+        nombre="Prueba",
+        precio_base=90,
+        es_premium=True,
+        caracteristicas={"XX": 5},
+    )
+    detalle = calcular_costos(membresia, numero_miembros=3, codigos_caracteristicas=["XX"])
+
+    assert detalle["recargo_premium"] == 43
+    assert detalle["descuento_grupal"] == 33
+    assert detalle["total"] == 275
+
+
+def test_membresia_es_inmutable_y_hashable():
+    """
+    Las características de una membresía no se pueden modificar y la
+    membresía se puede usar como clave (por ejemplo, en una caché).
+    """
+    membresia = MEMBRESIAS["BASIC"]
+    with pytest.raises(TypeError):
+        membresia.caracteristicas["CG"] = 40
+
+    copia = Membresia(
+        codigo="BASIC",
+        nombre="Básica",
+        precio_base=50,
+        es_premium=False,
+        caracteristicas={"CG": 20, "LK": 10},
+    )
+    assert copia == membresia
+    assert hash(copia) == hash(membresia)
+
+
+@solo_interpretado
+def test_calcular_costos_total_entero_con_numero_miembros_float():
+    """
+    El total debe ser siempre un int, aunque el número de miembros llegue como float.
+    """
+    detalle = calcular_costos(MEMBRESIAS["BASIC"], numero_miembros=2.0, codigos_caracteristicas=[])
+
+    assert detalle["total"] == 90
+    assert isinstance(detalle["total"], int)
+
+
 def test_calcular_costos_numero_miembros_invalido():
     """
     Si el número de miembros es <= 0, calcular_costos debe lanzar ValueError.
@@ -153,6 +232,15 @@ def test_calcular_costos_caracteristica_invalida():
         calcular_costos(membresia, numero_miembros=1, codigos_caracteristicas=["EP"])
 
 
+def test_calcular_costos_reporta_todas_las_caracteristicas_invalidas():
+    """
+    El mensaje de error debe listar todas las características inválidas.
+    """
+    membresia = MEMBRESIAS["BASIC"]
+    with pytest.raises(ValueError, match="EP, SPA"):
+        calcular_costos(membresia, numero_miembros=1, codigos_caracteristicas=["SPA", "CG", "EP"])
+
+
 def test_procesar_plan_membresia_cancelado():
     """
     Si el usuario no confirma (confirmar=False), el resultado debe ser -1.
@@ -219,6 +307,61 @@ def test_procesar_plan_membresia_valido_devuelve_entero_positivo():
     assert total > 0
 
 
+def test_procesar_plan_membresia_entradas_equivalentes_mismo_total():
+    """
+    El código en minúsculas y el orden de las características no cambian el total.
+    """
+    total_a = procesar_plan_membresia("PREMIUM", 2, ["EP", "SPA"], True)
+    total_b = procesar_plan_membresia("premium", 2, ["SPA", "EP"], True)
+
+    assert total_a == total_b == calcular_costos(MEMBRESIAS["PREMIUM"], 2, ["EP", "SPA"])["total"]
+
+
+def test_procesar_plan_membresia_refleja_cambios_en_el_catalogo(monkeypatch):
+    """
+    Si se reemplaza un plan del catálogo, el resultado debe usar los nuevos
+    costos aunque la misma consulta se haya hecho antes.
+    """
+    assert procesar_plan_membresia("BASIC", 1, ["CG"], True) == 70
+
+    nueva = Membresia(
+        codigo="BASIC",
+        nombre="Básica",
+        precio_base=50,
+        es_premium=False,
+        caracteristicas={"CG": 40, "LK": 10},
+    )
+    monkeypatch.setitem(MEMBRESIAS, "BASIC", nueva)
+
+    assert procesar_plan_membresia("BASIC", 1, ["CG"], True) == 90
+
+
+@solo_interpretado
+def test_procesar_plan_membresia_total_entero_tras_llamada_con_float():
+    """
+    Una llamada previa con un número de miembros float no debe cambiar el
+    tipo del resultado de una llamada con int.
+    """
+    procesar_plan_membresia("BASIC", 2.0, [], True)
+    total = procesar_plan_membresia("BASIC", 2, [], True)
+
+    assert total == 90
+    assert isinstance(total, int)
+
+
+def test_procesar_plan_membresia_caracteristica_no_comparable():
+    """
+    Códigos que no se pueden ordenar (p. ej. None junto a un str) deben devolver -1.
+    """
+    total = procesar_plan_membresia(
+        codigo_membresia="BASIC",
+        numero_miembros=1,
+        codigos_caracteristicas=["CG", None],
+        confirmar=True,
+    )
+    assert total == -1
+
+
 # ---------------------- PRUEBA DE ESTILO CON PYLINT ---------------------- #
 
 